@@ -1,31 +1,80 @@
+import io
+import operator
+import os
+import re
+import shutil
+import tempfile
+import weakref
+from collections import OrderedDict
 import pandas as pd
+from sampling import (approx_count_distinct, estimate_distinct_from_sample,
+                      read_csv_sample, sample_dataframe)
 
 class TableManager:
-    """Gerencia tabelas e procedimentos em memória."""
-    def __init__(self):
-        self.tables = {}
+    """Gerencia tabelas e procedimentos em memória.
+
+    Se ``memory_limit`` (em bytes) for definido, as tabelas menos usadas
+    recentemente são despejadas para disco quando o limite é excedido e
+    recarregadas de forma transparente em ``get_table``.
+    """
+    def __init__(self, memory_limit=None, spill_dir=None):
+        self.tables = OrderedDict()   # Tabelas residentes, por ordem de uso (LRU primeiro)
+        self.table_sizes = {}         # Tamanho em bytes das tabelas residentes
+        self.spilled = {}             # nome -> (ficheiro, tamanho) das tabelas em disco
         self.procedures = {}
+        self.memory_limit = memory_limit
+        self.spill_dir = spill_dir
+        self._spill_counter = 0       # Garante nomes únicos para os ficheiros de despejo
+        self.stats = {
+            'spills': 0,
+            'reloads': 0,
+            'bytes_spilled': 0,
+            'bytes_reloaded': 0,
+        }
+
+    def has_table(self, name):
+        """Verifica se uma tabela existe (em memória ou em disco)."""
+        return name in self.tables or name in self.spilled
+
+    def table_names(self):
+        """Devolve os nomes de todas as tabelas conhecidas."""
+        return list(self.tables) + list(self.spilled)
+
+    def memory_usage(self):
+        """Devolve o total de bytes ocupados pelas tabelas residentes."""
+        return sum(self.table_sizes.values())
 
     def add_table(self, name, df):
         """Adiciona uma tabela ao gerenciador."""
-        if name in self.tables:
+        if self.has_table(name):
             print(f"Erro: Tabela '{name}' já existe")
             return False
         self.tables[name] = df
+        self.table_sizes[name] = self._table_size(df)
         print(f"Tabela '{name}' adicionada")
+        self._enforce_memory_limit(keep=name)
         return True
 
     def get_table(self, name):
         """Obtém uma tabela pelo nome."""
-        if name not in self.tables:
-            print(f"Tabela '{name}' não encontrada")
-            return None
-        return self.tables[name]
+        if name in self.tables:
+            self.tables.move_to_end(name)
+            return self.tables[name]
+        if name in self.spilled:
+            return self._reload_table(name)
+        print(f"Tabela '{name}' não encontrada")
+        return None
 
     def remove_table(self, name):
         """Remove uma tabela do gerenciador."""
         if name in self.tables:
             del self.tables[name]
+            del self.table_sizes[name]
+            print(f"Tabela '{name}' removida")
+            return True
+        if name in self.spilled:
+            path, _ = self.spilled.pop(name)
+            self._remove_spill_file(path)
             print(f"Tabela '{name}' removida")
             return True
         print(f"Tabela '{name}' não encontrada")
@@ -33,14 +82,95 @@ class TableManager:
 
     def rename_table(self, old_name, new_name):
         """Renomeia uma tabela."""
+        if self.has_table(old_name) and self.has_table(new_name):
+            print(f"Erro: Tabela '{new_name}' já existe")
+            return False
         if old_name in self.tables:
-            self.tables[new_name] = self.tables[old_name]
-            del self.tables[old_name]
+            self.tables[new_name] = self.tables.pop(old_name)
+            self.table_sizes[new_name] = self.table_sizes.pop(old_name)
+            print(f"Tabela '{old_name}' renomeada para '{new_name}'")
+            return True
+        if old_name in self.spilled:
+            self.spilled[new_name] = self.spilled.pop(old_name)
             print(f"Tabela '{old_name}' renomeada para '{new_name}'")
             return True
         print(f"Tabela '{old_name}' não encontrada")
         return False
 
+    def print_memory_stats(self):
+        """Imprime as estatísticas de despejo/recarga de tabelas."""
+        stats = self.stats
+        print(f"Memória: {self.memory_usage()} bytes em {len(self.tables)} tabela(s) residente(s), "
+              f"{len(self.spilled)} tabela(s) em disco")
+        print(f"Despejos: {stats['spills']} ({stats['bytes_spilled']} bytes), "
+              f"recargas: {stats['reloads']} ({stats['bytes_reloaded']} bytes)")
+
+    def _table_size(self, df):
+        """Estima o tamanho em memória de uma tabela."""
+        try:
+            return int(df.memory_usage(index=True, deep=True).sum())
+        except Exception:
+            return 0
+
+    def _enforce_memory_limit(self, keep=None):
+        """Despeja tabelas LRU para disco até o limite de memória ser respeitado."""
+        if self.memory_limit is None:
+            return
+        while self.memory_usage() > self.memory_limit:
+            victim = next((n for n in self.tables if n != keep), None)
+            if victim is None:
+                break
+            if not self._spill_table(victim):
+                break
+
+    def _get_spill_dir(self):
+        if self.spill_dir is None:
+            self.spill_dir = tempfile.mkdtemp(prefix='cql_spill_')
+            weakref.finalize(self, shutil.rmtree, self.spill_dir, True)
+        else:
+            os.makedirs(self.spill_dir, exist_ok=True)
+        return self.spill_dir
+
+    def _spill_table(self, name):
+        """Grava uma tabela residente em disco e liberta-a da memória."""
+        df = self.tables[name]
+        self._spill_counter += 1
+        path = os.path.join(self._get_spill_dir(), f"{self._spill_counter}_{name}.pkl")
+        try:
+            df.to_pickle(path)
+        except Exception as e:
+            print(f"Aviso: Não foi possível despejar a tabela '{name}' para disco: {e}")
+            return False
+        size = self.table_sizes.pop(name)
+        del self.tables[name]
+        self.spilled[name] = (path, size)
+        self.stats['spills'] += 1
+        self.stats['bytes_spilled'] += size
+        return True
+
+    def _reload_table(self, name):
+        """Recarrega uma tabela despejada para memória."""
+        path, size = self.spilled[name]
+        try:
+            df = pd.read_pickle(path)
+        except Exception as e:
+            print(f"Erro ao recarregar a tabela '{name}' do disco: {e}")
+            return None
+        del self.spilled[name]
+        self._remove_spill_file(path)
+        self.tables[name] = df
+        self.table_sizes[name] = size
+        self.stats['reloads'] += 1
+        self.stats['bytes_reloaded'] += size
+        self._enforce_memory_limit(keep=name)
+        return df
+
+    def _remove_spill_file(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
     def add_procedure(self, name, statements):
         """Adiciona um procedimento ao gerenciador."""
         self.procedures[name] = statements
@@ -59,6 +189,97 @@ class Command:
     def execute(self, table_manager):
         raise NotImplementedError("Subclasses devem implementar o método execute")
 
+COMPARISON_OPS = {
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le,
+    '=': operator.eq,
+    '<>': operator.ne,
+}
+
+def like_mask(series, pattern):
+    """Avalia LIKE de forma vetorizada, usando prefixo/sufixo/substring quando possível."""
+    if not pd.api.types.is_string_dtype(series):
+        series = series.astype(str)
+    body = pattern.strip('%')
+    if '_' not in pattern and '%' not in body:
+        starts, ends = pattern.startswith('%'), pattern.endswith('%')
+        if starts and ends:
+            return series.str.contains(body, regex=False, na=False)
+        elif ends:
+            return series.str.startswith(body, na=False)
+        elif starts:
+            return series.str.endswith(body, na=False)
+        return series == body
+    regex = ''.join('.*' if c == '%' else '.' if c == '_' else re.escape(c) for c in pattern)
+    return series.str.fullmatch(re.compile(regex, re.DOTALL), na=False)
+
+def condition_mask(df, condition):
+    """Avalia uma condição sobre toda a tabela, devolvendo uma máscara booleana."""
+    return condition_truth(df, condition)[0]
+
+def condition_truth(df, condition):
+    """Avalia uma condição com lógica de três valores (como em SQL).
+
+    Devolve as máscaras (verdadeiro, falso); as linhas em que nenhuma é
+    verdadeira têm resultado desconhecido (NULL) e são excluídas mesmo com NOT.
+    """
+    kind = condition[0]
+    if kind == 'and':
+        left_true, left_false = condition_truth(df, condition[1])
+        right_true, right_false = condition_truth(df, condition[2])
+        return left_true & right_true, left_false | right_false
+    elif kind == 'or':
+        left_true, left_false = condition_truth(df, condition[1])
+        right_true, right_false = condition_truth(df, condition[2])
+        return left_true | right_true, left_false & right_false
+    elif kind == 'not':
+        inner_true, inner_false = condition_truth(df, condition[1])
+        return inner_false, inner_true
+    unknown = pd.Series(False, index=df.index)
+    missing = [column for column in condition_columns(condition) if column not in df.columns]
+    if missing:
+        for column in missing:
+            print(f"Aviso: Coluna '{column}' não encontrada")
+        return unknown, unknown
+    column = df[condition[1]]
+    null = column.isna()
+    if kind == 'cond':
+        mask = COMPARISON_OPS[condition[2]](column, condition[3])
+    elif kind == 'cond_col':
+        mask = COMPARISON_OPS[condition[2]](column, df[condition[3]])
+        null = null | df[condition[3]].isna()
+    elif kind == 'in':
+        mask = column.isin(condition[2])
+    elif kind == 'between':
+        mask = column.between(condition[2], condition[3])
+    elif kind == 'like':
+        mask = like_mask(column, condition[2])
+    else:
+        return unknown, unknown
+    mask = mask.fillna(False).astype(bool)
+    return mask & ~null, ~mask & ~null
+
+def condition_conjuncts(condition):
+    """Divide uma condição nas suas partes ligadas por AND."""
+    if condition is None:
+        return []
+    if condition[0] == 'and':
+        return condition_conjuncts(condition[1]) + condition_conjuncts(condition[2])
+    return [condition]
+
+def condition_columns(condition):
+    """Devolve o conjunto de colunas referidas por uma condição."""
+    kind = condition[0]
+    if kind in ('and', 'or'):
+        return condition_columns(condition[1]) | condition_columns(condition[2])
+    elif kind == 'not':
+        return condition_columns(condition[1])
+    elif kind == 'cond_col':
+        return {condition[1], condition[3]}
+    return {condition[1]}
+
 class ImportCommand(Command):
     """Comando para importar uma tabela de um arquivo CSV."""
     def __init__(self, table_name, filename):
@@ -67,22 +288,29 @@ class ImportCommand(Command):
 
     def execute(self, table_manager):
         try:
-            filename = self.filename.strip('"\'')
-            try:
-                df = pd.read_csv(filename, comment='#', quotechar='"')
-            except Exception as e:
-                print(f"Aviso: Leitura padrão falhou, usando parser personalizado: {e}")
-                df = self.read_csv_custom(filename)
+            df = self.read_file(self.filename)
             return table_manager.add_table(self.table_name, df)
         except Exception as e:
             print(f"Erro ao importar tabela: {e}")
             return None
 
+    def read_file(self, filename):
+        """Lê um ficheiro CSV (ou texto CSV já em memória), recorrendo ao parser personalizado se necessário."""
+        if isinstance(filename, str):
+            filename = filename.strip('"\'')
+        try:
+            return pd.read_csv(filename, comment='#', quotechar='"')
+        except Exception as e:
+            print(f"Aviso: Leitura padrão falhou, usando parser personalizado: {e}")
+            if hasattr(filename, 'seek'):
+                filename.seek(0)
+            return self.read_csv_custom(filename)
+
     def read_csv_custom(self, filename):
         """Função personalizada para ler CSV com suporte a comentários e aspas."""
         rows = []
         header = None
-        with open(filename, 'r') as file:
+        with (open(filename, 'r') if isinstance(filename, str) else filename) as file:
             for line in file:
                 if line.strip().startswith('#'):
                     continue
@@ -165,28 +393,28 @@ class PrintCommand(Command):
         return df
 
 class SelectCommand(Command):
-    """Comando para selecionar dados de uma tabela."""
-    def __init__(self, columns, table_name, condition, limit):
+    """Comando para selecionar dados de uma tabela ou diretamente de um ficheiro CSV."""
+    def __init__(self, columns, table_name, condition, limit, sample=None):
         self.columns = columns
         self.table_name = table_name
         self.condition = condition
         self.limit = limit
+        self.sample = sample          # ('sample', método, percentagem, semente) ou None
+        self.sample_fraction = 1.0    # Fração da origem efetivamente lida pela amostra
 
     def execute(self, table_manager):
-        df = table_manager.get_table(self.table_name)
+        df = self.load_source(table_manager)
         if df is None:
             return None
-        df = df.copy()
         if self.condition:
-            filtered_rows = []
-            for _, row in df.iterrows():
-                if self.evaluate_condition(row, self.condition):
-                    filtered_rows.append(row)
-            if filtered_rows:
-                df = pd.DataFrame(filtered_rows)
-            else:
-                df = pd.DataFrame(columns=df.columns)
-        if self.columns != '*':
+            df = df[condition_mask(df, self.condition)]
+        else:
+            df = df.copy()
+        if self.columns != '*' and any(isinstance(col, tuple) for col in self.columns):
+            df = self.aggregate(df)
+            if df is None:
+                return pd.DataFrame()
+        elif self.columns != '*':
             valid_columns = [col for col in self.columns if col in df.columns]
             if valid_columns:
                 df = df[valid_columns]
@@ -199,28 +427,46 @@ class SelectCommand(Command):
         print(df)
         return df
 
-    def evaluate_condition(self, row, condition):
-        if condition[0] == 'cond':
-            column, op, value = condition[1], condition[2], condition[3]
-            if column not in row:
+    def load_source(self, table_manager):
+        """Obtém a tabela de origem, aplicando TABLESAMPLE se indicado."""
+        if self.sample:
+            seed = self.sample[3]
+            if seed is not None and (not isinstance(seed, int) or seed < 0):
+                print(f"Erro: A semente de REPEATABLE deve ser um inteiro não negativo (recebido {seed})")
+                return None
+        if isinstance(self.table_name, tuple):
+            filename = self.table_name[1].strip('"\'')
+            try:
+                if self.sample:
+                    _, method, percent, seed = self.sample
+                    text, self.sample_fraction = read_csv_sample(filename, method, percent, seed)
+                    return ImportCommand(None, filename).read_file(io.StringIO(text))
+                return ImportCommand(None, filename).read_file(filename)
+            except Exception as e:
+                print(f"Erro ao ler o ficheiro '{filename}': {e}")
+                return None
+        df = table_manager.get_table(self.table_name)
+        if df is not None and self.sample:
+            _, method, percent, seed = self.sample
+            df, self.sample_fraction = sample_dataframe(df, method, percent, seed)
+        return df
+
+    def aggregate(self, df):
+        """Calcula agregados aproximados, devolvendo uma tabela com uma linha."""
+        if not all(isinstance(col, tuple) for col in self.columns):
+            print("Erro: Não é possível misturar colunas e agregados no mesmo SELECT")
+            return None
+        result = {}
+        for func, column in self.columns:
+            if column not in df.columns:
                 print(f"Aviso: Coluna '{column}' não encontrada")
-                return False
-            cell_value = row[column]
-            if op == '>':
-                return cell_value > value
-            elif op == '<':
-                return cell_value < value
-            elif op == '>=':
-                return cell_value >= value
-            elif op == '<=':
-                return cell_value <= value
-            elif op == '=':
-                return cell_value == value
-            elif op == '<>':
-                return cell_value != value
-        elif condition[0] == 'and':
-            return self.evaluate_condition(row, condition[1]) and self.evaluate_condition(row, condition[2])
-        return False
+                return None
+            if self.sample:
+                value = estimate_distinct_from_sample(df[column], self.sample_fraction)
+            else:
+                value = approx_count_distinct(df[column])
+            result[f"{func}({column})"] = [value]
+        return pd.DataFrame(result)
 
 class CreateSelectCommand(Command):
     """Comando para criar uma tabela a partir de um SELECT."""
@@ -239,33 +485,179 @@ class CreateSelectCommand(Command):
         return False
 
 class CreateJoinCommand(Command):
-    """Comando para criar uma tabela a partir de um JOIN."""
-    def __init__(self, new_table, table1, table2, join_column):
+    """Comando para criar uma tabela a partir de um JOIN de várias tabelas.
+
+    A ordem das junções é escolhida a partir da cardinalidade das tabelas e do
+    número de valores distintos das chaves; os filtros do WHERE são aplicados
+    antes das junções sempre que possível e os resultados intermédios não são
+    registados como tabelas.
+    """
+    def __init__(self, new_table, base_table, joins, condition=None):
         self.new_table = new_table
-        self.table1 = table1
-        self.table2 = table2
-        self.join_column = join_column
+        self.base_table = base_table
+        self.joins = joins            # Lista de pares (tabela, coluna)
+        self.condition = condition
 
     def execute(self, table_manager):
-        df1 = table_manager.get_table(self.table1)
-        df2 = table_manager.get_table(self.table2)
-        if df1 is None or df2 is None:
-            return False
-        if self.join_column not in df1.columns:
-            print(f"Coluna '{self.join_column}' não encontrada em '{self.table1}'")
+        names = [self.base_table] + [table for table, _ in self.joins]
+        if len(set(names)) != len(names):
+            print("Erro: A mesma tabela não pode aparecer mais de uma vez no JOIN")
             return False
-        if self.join_column not in df2.columns:
-            print(f"Coluna '{self.join_column}' não encontrada em '{self.table2}'")
+        frames = {}
+        for name in names:
+            df = table_manager.get_table(name)
+            if df is None:
+                return False
+            frames[name] = df
+        edges = self.build_join_graph(frames)
+        if edges is None:
             return False
+        holders = self.column_holders(frames, edges)
         try:
-            joined_df = pd.merge(df1, df2, on=self.join_column)
+            pushed = self.push_down_filters(frames, holders)
+            if pushed is None:
+                return False
+            frames, residual = pushed
+            frames = self.qualify_shared_columns(frames, holders)
+            joined_df = self.run_joins(frames, edges, names)
+            for cond in residual:
+                joined_df = joined_df[condition_mask(joined_df, cond)]
+            joined_df = joined_df.reset_index(drop=True)
             table_manager.add_table(self.new_table, joined_df)
-            print(f"Tabela '{self.new_table}' criada da junção de '{self.table1}' e '{self.table2}'")
+            print(f"Tabela '{self.new_table}' criada da junção de "
+                  + ", ".join(f"'{name}'" for name in names))
             return True
         except Exception as e:
             print(f"Erro ao criar tabela da junção: {e}")
             return False
 
+    def build_join_graph(self, frames):
+        """Cria as arestas (tabela_a, tabela_b, coluna) definidas pelas cláusulas USING."""
+        edges = []
+        previous = [self.base_table]
+        for table, column in self.joins:
+            if column not in frames[table].columns:
+                print(f"Coluna '{column}' não encontrada em '{table}'")
+                return None
+            partners = [name for name in previous if column in frames[name].columns]
+            if not partners:
+                print(f"Coluna '{column}' não encontrada em '{', '.join(previous)}'")
+                return None
+            for partner in partners:
+                edges.append((partner, table, column))
+            previous.append(table)
+        return edges
+
+    def column_holders(self, frames, edges):
+        """Indica, para cada coluna, as tabelas que fornecem essa coluna ao resultado.
+
+        Uma coluna de junção pertence às tabelas ligadas por ela (os valores são
+        iguais depois da junção); qualquer outra coluna só tem dono se existir
+        numa única tabela. Nos restantes casos a coluna é ambígua (conjunto vazio).
+        """
+        key_tables = {}
+        for a, b, column in edges:
+            key_tables.setdefault(column, set()).update((a, b))
+        holders = {}
+        for name, df in frames.items():
+            for column in df.columns:
+                holders.setdefault(column, set()).add(name)
+        for column, tables in holders.items():
+            if column in key_tables:
+                holders[column] = key_tables[column]
+            elif len(tables) > 1:
+                holders[column] = set()
+        return holders
+
+    def push_down_filters(self, frames, holders):
+        """Aplica cada parte do WHERE diretamente às tabelas de origem quando possível."""
+        residual = []
+        frames = dict(frames)
+        for cond in condition_conjuncts(self.condition):
+            columns = condition_columns(cond)
+            for column in columns:
+                if column not in holders:
+                    print(f"Erro: Coluna '{column}' não encontrada nas tabelas do JOIN")
+                    return None
+                if not holders[column]:
+                    print(f"Erro: Coluna '{column}' é ambígua (existe em várias tabelas do JOIN)")
+                    return None
+            owners = set.intersection(*(holders[column] for column in columns))
+            if owners:
+                for name in owners:
+                    frames[name] = frames[name][condition_mask(frames[name], cond)]
+            else:
+                residual.append(cond)
+        return frames, residual
+
+    def qualify_shared_columns(self, frames, holders):
+        """Renomeia para 'tabela_coluna' as colunas repetidas que não são chave da junção.
+
+        Assim os nomes do resultado dependem da posição das tabelas no comando e
+        não da ordem escolhida para as junções, e continuam a ser identificadores
+        válidos em instruções posteriores.
+        """
+        existing = {column for df in frames.values() for column in df.columns}
+        qualified = {}
+        for name, df in frames.items():
+            renames = {column: f"{name}_{column}" for column in df.columns
+                       if name not in holders[column]}
+            clashes = [new for new in renames.values() if new in existing]
+            if clashes:
+                raise ValueError(f"a coluna '{clashes[0]}' já existe numa das tabelas")
+            qualified[name] = df.rename(columns=renames) if renames else df
+        return qualified
+
+    def run_joins(self, frames, edges, names):
+        """Executa as junções pela ordem de menor custo estimado."""
+        # Começar pela menor tabela do par com o menor resultado estimado
+        a, b, _ = min(edges, key=lambda e: self.estimate_join_size(
+            frames[e[0]], frames[e[1]], self.join_keys(frames[e[0]], frames[e[1]])))
+        start = a if len(frames[a]) <= len(frames[b]) else b
+        remaining = set(frames) - {start}
+        current = frames[start]
+        while remaining:
+            candidates = []
+            for name in remaining:
+                keys = self.join_keys(current, frames[name])
+                if keys:
+                    candidates.append((self.estimate_join_size(current, frames[name], keys), name, keys))
+            if not candidates:
+                raise ValueError("não existe uma coluna comum para continuar a junção")
+            _, name, keys = min(candidates, key=lambda c: (c[0], names.index(c[1])))
+            current = pd.merge(current, frames[name], on=keys)
+            remaining.discard(name)
+        return current[self.output_columns(current, frames, names)]
+
+    def join_keys(self, left, right):
+        """Colunas pelas quais duas relações são juntas.
+
+        Depois de qualify_shared_columns, as únicas colunas com o mesmo nome em
+        duas tabelas são chaves de junção, iguais (diretamente ou por
+        transitividade) em todas as tabelas que as fornecem; juntar por todas
+        elas evita que o pandas acrescente sufixos a uma chave.
+        """
+        return [column for column in left.columns if column in right.columns]
+
+    def estimate_join_size(self, left, right, keys):
+        """Estima o tamanho de uma junção: |L| * |R| / max(distintos(L), distintos(R))."""
+        if not keys:
+            return len(left) * len(right)
+        if len(left) == 0 or len(right) == 0:
+            return 0
+        left_distinct = max(len(left[keys].drop_duplicates()), 1)
+        right_distinct = max(len(right[keys].drop_duplicates()), 1)
+        return len(left) * len(right) / max(left_distinct, right_distinct)
+
+    def output_columns(self, joined_df, frames, names):
+        """Ordena as colunas do resultado pela ordem das tabelas no comando."""
+        ordered = []
+        for name in names:
+            for column in frames[name].columns:
+                if column in joined_df.columns and column not in ordered:
+                    ordered.append(column)
+        return ordered + [column for column in joined_df.columns if column not in ordered]
+
 class ProcedureDefCommand(Command):
     """Comando para definir um procedimento."""
     def __init__(self, proc_name, statements):
@@ -312,7 +704,7 @@ class CommandExecutor:
         elif cmd_type == 'print_table':
             cmd = PrintCommand(statement[1])
         elif cmd_type == 'select':
-            cmd = SelectCommand(statement[1], statement[2], statement[3], statement[4])
+            cmd = SelectCommand(statement[1], statement[2], statement[3], statement[4], statement[5])
         elif cmd_type == 'create_select':
             cmd = CreateSelectCommand(statement[1], statement[2])
         elif cmd_type == 'create_join':
@@ -37,6 +37,17 @@ class CQLLexer:
             'using': 'USING',
             'limit': 'LIMIT',
             'and': 'AND',
+            'or': 'OR',
+            'not': 'NOT',
+            'in': 'IN',
+            'between': 'BETWEEN',
+            'like': 'LIKE',
+            'tablesample': 'TABLESAMPLE',
+            'percent': 'PERCENT',
+            'bernoulli': 'BERNOULLI',
+            'block': 'BLOCK',
+            'repeatable': 'REPEATABLE',
+            'approx_count_distinct': 'APPROX_COUNT_DISTINCT',
             'procedure': 'PROCEDURE',
             'do': 'DO',
             'end': 'END',
@@ -1,13 +1,15 @@
 from lexer import CQLLexer
 from parser import CQLParser
 from executor import CommandExecutor, TableManager
+from watch import ScriptWatcher
+import argparse
 import sys
 
 class CQLInterpreter:
-    def __init__(self):
+    def __init__(self, memory_limit=None):
         self.lexer = CQLLexer()
         self.parser = CQLParser(lexer=self.lexer)
-        self.table_manager = TableManager()
+        self.table_manager = TableManager(memory_limit=memory_limit)
         self.executor = CommandExecutor(self.table_manager)
         self.buffer = ""
 
@@ -24,11 +26,20 @@ class CQLInterpreter:
                     for stmt in result:
                         if stmt:
                             self.executor.execute_statement(stmt)
+                self.report_memory()
         except FileNotFoundError:
             print(f"Arquivo não encontrado: {filename}")
         except Exception as e:
             print(f"Erro ao processar arquivo: {e}")
 
+    def watch_file(self, filename, interval):
+        watcher = ScriptWatcher(self.parser, filename, interval=interval)
+        watcher.watch()
+
+    def report_memory(self):
+        if self.table_manager.memory_limit is not None:
+            self.table_manager.print_memory_stats()
+
     def run_interactive(self):
         print("CQL Interpreter - Digite 'exit;' para sair")
         while True:
@@ -52,9 +63,28 @@ class CQLInterpreter:
                 self.buffer = ""
 
 def main():
-    interpreter = CQLInterpreter()
-    if len(sys.argv) > 1:
-        interpreter.run_file(sys.argv[1])
+    arg_parser = argparse.ArgumentParser(description="Interpretador CQL")
+    arg_parser.add_argument('script', nargs='?', help="ficheiro .fca a executar")
+    arg_parser.add_argument('--memory-limit', type=float, default=None, metavar='MB',
+                            help="limite de memória para tabelas (MB); as menos usadas são despejadas para disco")
+    arg_parser.add_argument('--watch', action='store_true',
+                            help="voltar a executar o script sempre que os ficheiros de entrada mudarem")
+    arg_parser.add_argument('--interval', type=float, default=2.0, metavar='SEGUNDOS',
+                            help="intervalo entre verificações no modo --watch")
+    args = arg_parser.parse_args()
+    if args.watch and not args.script:
+        arg_parser.error("--watch requer um ficheiro .fca")
+    if args.interval <= 0:
+        arg_parser.error("--interval deve ser maior do que zero")
+    if args.watch and args.memory_limit is not None:
+        # A cache do modo --watch guarda todas as tabelas em memória, anulando os despejos
+        arg_parser.error("--memory-limit não pode ser usado com --watch")
+    memory_limit = int(args.memory_limit * 1024 * 1024) if args.memory_limit is not None else None
+    interpreter = CQLInterpreter(memory_limit=memory_limit)
+    if args.watch:
+        interpreter.watch_file(args.script, args.interval)
+    elif args.script:
+        interpreter.run_file(args.script)
     else:
         interpreter.run_interactive()
 
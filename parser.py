@@ -8,7 +8,9 @@ class CQLParser:
         self.tokens = self.lexer.get_tokens()
         self.parser = None
         self.precedence = (
+            ('left', 'OR'),      # OR tem a menor prioridade
             ('left', 'AND'),     # Avalia da esquerda para a direita
+            ('right', 'NOT'),
             ('nonassoc', 'GT', 'LT', 'GE', 'LE', 'EQ', 'NE'),  # >, <, >=, <=, =, !=
         )
         self.build()
@@ -74,19 +76,49 @@ class CQLParser:
         p[0] = ('print_table', p[3])
 
     def p_select_statement(self, p):
-        '''select_statement : SELECT column_list FROM ID
-                            | SELECT column_list FROM ID WHERE condition
-                            | SELECT column_list FROM ID LIMIT NUMBER
-                            | SELECT column_list FROM ID WHERE condition LIMIT NUMBER'''
-        if len(p) == 5:
-            p[0] = ('select', p[2], p[4], None, None)
-        elif len(p) == 7:
-            if p[5].lower() == 'where':
-                p[0] = ('select', p[2], p[4], p[6], None)
-            else:
-                p[0] = ('select', p[2], p[4], None, p[6])
-        elif len(p) == 9:
-            p[0] = ('select', p[2], p[4], p[6], p[8])
+        '''select_statement : SELECT column_list FROM source opt_sample opt_where opt_limit'''
+        p[0] = ('select', p[2], p[4], p[6], p[7], p[5])
+
+    def p_source(self, p):
+        '''source : ID
+                  | STRING'''
+        if p.slice[1].type == 'STRING':
+            p[0] = ('file', p[1])
+        else:
+            p[0] = p[1]
+
+    def p_opt_sample(self, p):
+        '''opt_sample : TABLESAMPLE sample_method NUMBER PERCENT opt_seed
+                      | empty'''
+        if len(p) == 2:
+            p[0] = None
+        else:
+            p[0] = ('sample', p[2], p[3], p[5])
+
+    def p_sample_method(self, p):
+        '''sample_method : BERNOULLI
+                         | BLOCK
+                         | empty'''
+        p[0] = p[1].lower() if p[1] else 'bernoulli'
+
+    def p_opt_seed(self, p):
+        '''opt_seed : REPEATABLE LPAREN NUMBER RPAREN
+                    | empty'''
+        p[0] = p[3] if len(p) == 5 else None
+
+    def p_opt_where(self, p):
+        '''opt_where : WHERE condition
+                     | empty'''
+        p[0] = p[2] if len(p) == 3 else None
+
+    def p_opt_limit(self, p):
+        '''opt_limit : LIMIT NUMBER
+                     | empty'''
+        p[0] = p[2] if len(p) == 3 else None
+
+    def p_empty(self, p):
+        'empty :'
+        p[0] = None
 
     def p_column_list(self, p):
         '''column_list : ASTERISK
@@ -94,21 +126,77 @@ class CQLParser:
         p[0] = p[1]
 
     def p_column_id_list(self, p):
-        '''column_id_list : ID
-                          | column_id_list COMMA ID'''
+        '''column_id_list : select_item
+                          | column_id_list COMMA select_item'''
         if len(p) == 2:
             p[0] = [p[1]]
         else:
             p[1].append(p[3])
             p[0] = p[1]
 
+    def p_select_item(self, p):
+        '''select_item : ID
+                       | APPROX_COUNT_DISTINCT LPAREN ID RPAREN'''
+        if len(p) == 2:
+            p[0] = p[1]
+        else:
+            p[0] = ('approx_count_distinct', p[3])
+
     def p_condition(self, p):
-        '''condition : ID comparison_op expression
-                     | condition AND condition'''
-        if len(p) == 4 and p[2].lower() != 'and':
+        '''condition : predicate
+                     | condition AND condition
+                     | condition OR condition
+                     | NOT condition
+                     | LPAREN condition RPAREN'''
+        if len(p) == 2:
+            p[0] = p[1]
+        elif len(p) == 3:
+            p[0] = ('not', p[2])
+        elif p[1] == '(':
+            p[0] = p[2]
+        else:
+            p[0] = (p[2].lower(), p[1], p[3])
+
+    def p_predicate_compare(self, p):
+        '''predicate : ID comparison_op literal
+                     | ID comparison_op ID'''
+        if p.slice[3].type == 'ID':
+            p[0] = ('cond_col', p[1], p[2], p[3])
+        else:
             p[0] = ('cond', p[1], p[2], p[3])
+
+    def p_predicate_in(self, p):
+        '''predicate : ID IN LPAREN literal_list RPAREN
+                     | ID NOT IN LPAREN literal_list RPAREN'''
+        if len(p) == 6:
+            p[0] = ('in', p[1], p[4])
+        else:
+            p[0] = ('not', ('in', p[1], p[5]))
+
+    def p_predicate_between(self, p):
+        '''predicate : ID BETWEEN literal AND literal
+                     | ID NOT BETWEEN literal AND literal'''
+        if len(p) == 6:
+            p[0] = ('between', p[1], p[3], p[5])
+        else:
+            p[0] = ('not', ('between', p[1], p[4], p[6]))
+
+    def p_predicate_like(self, p):
+        '''predicate : ID LIKE STRING
+                     | ID NOT LIKE STRING'''
+        if len(p) == 4:
+            p[0] = ('like', p[1], p[3])
         else:
-            p[0] = ('and', p[1], p[3])
+            p[0] = ('not', ('like', p[1], p[4]))
+
+    def p_literal_list(self, p):
+        '''literal_list : literal
+                        | literal_list COMMA literal'''
+        if len(p) == 2:
+            p[0] = [p[1]]
+        else:
+            p[1].append(p[3])
+            p[0] = p[1]
 
     def p_comparison_op(self, p):
         '''comparison_op : GT
@@ -119,19 +207,30 @@ class CQLParser:
                          | NE'''
         p[0] = p[1]
 
-    def p_expression(self, p):
-        '''expression : ID
-                      | NUMBER
-                      | STRING'''
+    def p_literal(self, p):
+        '''literal : NUMBER
+                   | STRING'''
         p[0] = p[1]
 
     def p_create_statement(self, p):
         '''create_statement : CREATE TABLE ID select_statement
-                            | CREATE TABLE ID FROM ID JOIN ID USING LPAREN ID RPAREN'''
+                            | CREATE TABLE ID FROM ID join_list
+                            | CREATE TABLE ID FROM ID join_list WHERE condition'''
         if len(p) == 5:
             p[0] = ('create_select', p[3], p[4])
+        elif len(p) == 7:
+            p[0] = ('create_join', p[3], p[5], p[6], None)
         else:
-            p[0] = ('create_join', p[3], p[5], p[7], p[10])
+            p[0] = ('create_join', p[3], p[5], p[6], p[8])
+
+    def p_join_list(self, p):
+        '''join_list : JOIN ID USING LPAREN ID RPAREN
+                     | join_list JOIN ID USING LPAREN ID RPAREN'''
+        if len(p) == 7:
+            p[0] = [(p[2], p[5])]
+        else:
+            p[1].append((p[3], p[6]))
+            p[0] = p[1]
 
     def p_procedure_definition(self, p):
         'procedure_definition : PROCEDURE ID DO proc_statement_list END'
@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'leftANDnonassocGTLTGELEEQNEAND AS ASTERISK CALL COMMA CREATE DISCARD DO END EQ EXPORT FROM GE GT ID IMPORT JOIN LE LIMIT LPAREN LT NE NUMBER PRINT PROCEDURE RENAME RPAREN SELECT SEMICOLON STRING TABLE USING WHEREprogram : statement_liststatement_list : statement\n| statement_list statementstatement : import_statement SEMICOLON\n| export_statement SEMICOLON\n| discard_statement SEMICOLON\n| rename_statement SEMICOLON\n| print_statement SEMICOLON\n| select_statement SEMICOLON\n| create_statement SEMICOLON\n| procedure_definition SEMICOLON\n| call_statement SEMICOLONstatement : SEMICOLONimport_statement : IMPORT TABLE ID FROM STRINGexport_statement : EXPORT TABLE ID AS STRINGdiscard_statement : DISCARD TABLE IDrename_statement : RENAME TABLE ID IDprint_statement : PRINT TABLE IDselect_statement : SELECT column_list FROM ID\n| SELECT column_list FROM ID WHERE condition\n| SELECT column_list FROM ID LIMIT NUMBER\n| SELECT column_list FROM ID WHERE condition LIMIT NUMBERcolumn_list : ASTERISK\n| column_id_listcolumn_id_list : ID\n| column_id_list COMMA IDcondition : ID comparison_op expression\n| condition AND conditioncomparison_op : GT\n| LT\n| GE\n| LE\n| EQ\n| NEexpression : ID\n| NUMBER\n| STRINGcreate_statement : CREATE TABLE ID select_statement\n| CREATE TABLE ID FROM ID JOIN ID USING LPAREN ID RPARENprocedure_definition : PROCEDURE ID DO proc_statement_list ENDproc_statement_list : proc_statement\n| proc_statement_list proc_statementproc_statement : import_statement SEMICOLON\n| export_statement SEMICOLON\n| discard_statement SEMICOLON\n| rename_statement SEMICOLON\n| print_statement SEMICOLON\n| select_statement SEMICOLON\n| create_statement SEMICOLON\n| call_statement SEMICOLON\n| SEMICOLONcall_statement : CALL ID'
+_lr_signature = 'leftORleftANDrightNOTnonassocGTLTGELEEQNEAND APPROX_COUNT_DISTINCT AS ASTERISK BERNOULLI BETWEEN BLOCK CALL COMMA CREATE DISCARD DO END EQ EXPORT FROM GE GT ID IMPORT IN JOIN LE LIKE LIMIT LPAREN LT NE NOT NUMBER OR PERCENT PRINT PROCEDURE RENAME REPEATABLE RPAREN SELECT SEMICOLON STRING TABLE TABLESAMPLE USING WHEREprogram : statement_liststatement_list : statement\n                          | statement_list statementstatement : import_statement SEMICOLON\n                     | export_statement SEMICOLON\n                     | discard_statement SEMICOLON\n                     | rename_statement SEMICOLON\n                     | print_statement SEMICOLON\n                     | select_statement SEMICOLON\n                     | create_statement SEMICOLON\n                     | procedure_definition SEMICOLON\n                     | call_statement SEMICOLONstatement : SEMICOLONimport_statement : IMPORT TABLE ID FROM STRINGexport_statement : EXPORT TABLE ID AS STRINGdiscard_statement : DISCARD TABLE IDrename_statement : RENAME TABLE ID IDprint_statement : PRINT TABLE IDselect_statement : SELECT column_list FROM source opt_sample opt_where opt_limitsource : ID\n                  | STRINGopt_sample : TABLESAMPLE sample_method NUMBER PERCENT opt_seed\n                      | emptysample_method : BERNOULLI\n                         | BLOCK\n                         | emptyopt_seed : REPEATABLE LPAREN NUMBER RPAREN\n                    | emptyopt_where : WHERE condition\n                     | emptyopt_limit : LIMIT NUMBER\n                     | emptyempty :column_list : ASTERISK\n                       | column_id_listcolumn_id_list : select_item\n                          | column_id_list COMMA select_itemselect_item : ID\n                       | APPROX_COUNT_DISTINCT LPAREN ID RPARENcondition : predicate\n                     | condition AND condition\n                     | condition OR condition\n                     | NOT condition\n                     | LPAREN condition RPARENpredicate : ID comparison_op literal\n                     | ID comparison_op IDpredicate : ID IN LPAREN literal_list RPAREN\n                     | ID NOT IN LPAREN literal_list RPARENpredicate : ID BETWEEN literal AND literal\n                     | ID NOT BETWEEN literal AND literalpredicate : ID LIKE STRING\n                     | ID NOT LIKE STRINGliteral_list : literal\n                        | literal_list COMMA literalcomparison_op : GT\n                         | LT\n                         | GE\n                         | LE\n                         | EQ\n                         | NEliteral : NUMBER\n                   | STRINGcreate_statement : CREATE TABLE ID select_statement\n                            | CREATE TABLE ID FROM ID join_list\n                            | CREATE TABLE ID FROM ID join_list WHERE conditionjoin_list : JOIN ID USING LPAREN ID RPAREN\n                     | join_list JOIN ID USING LPAREN ID RPARENprocedure_definition : PROCEDURE ID DO proc_statement_list ENDproc_statement_list : proc_statement\n                               | proc_statement_list proc_statementproc_statement : import_statement SEMICOLON\n                          | export_statement SEMICOLON\n                          | discard_statement SEMICOLON\n                          | rename_statement SEMICOLON\n                          | print_statement SEMICOLON\n                          | select_statement SEMICOLON\n                          | create_statement SEMICOLON\n                          | call_statement SEMICOLON\n                          | SEMICOLONcall_statement : CALL ID'
     
-_lr_action_items = {'SEMICOLON':([0,2,3,4,5,6,7,8,9,10,11,12,13,23,24,25,26,27,28,29,30,31,32,44,47,49,53,56,57,59,61,62,63,64,65,66,67,68,69,70,71,72,73,77,78,79,80,81,82,83,84,85,86,88,89,101,102,103,104,105,106,110,],[5,5,-2,24,-13,25,26,27,28,29,30,31,32,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-52,-16,-18,64,-17,-19,-38,64,-41,79,-51,80,81,82,83,84,85,86,-14,-15,-40,-42,-43,-44,-45,-46,-47,-48,-49,-50,-20,-21,-35,-27,-36,-37,-22,-28,-39,]),'IMPORT':([0,2,3,5,23,24,25,26,27,28,29,30,31,32,53,61,62,64,78,79,80,81,82,83,84,85,86,],[14,14,-2,-13,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,14,14,-41,-51,-42,-43,-44,-45,-46,-47,-48,-49,-50,]),'EXPORT':([0,2,3,5,23,24,25,26,27,28,29,30,31,32,53,61,62,64,78,79,80,81,82,83,84,85,86,],[15,15,-2,-13,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,15,15,-41,-51,-42,-43,-44,-45,-46,-47,-48,-49,-50,]),'DISCARD':([0,2,3,5,23,24,25,26,27,28,29,30,31,32,53,61,62,64,78,79,80,81,82,83,84,85,86,],[16,16,-2,-13,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,16,16,-41,-51,-42,-43,-44,-45,-46,-47,-48,-49,-50,]),'RENAME':([0,2,3,5,23,24,25,26,27,28,29,30,31,32,53,61,62,64,78,79,80,81,82,83,84,85,86,],[17,17,-2,-13,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,17,17,-41,-51,-42,-43,-44,-45,-46,-47,-48,-49,-50,]),'PRINT':([0,2,3,5,23,24,25,26,27,28,29,30,31,32,53,61,62,64,78,79,80,81,82,83,84,85,86,],[18,18,-2,-13,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,18,18,-41,-51,-42,-43,-44,-45,-46,-47,-48,-49,-50,]),'SELECT':([0,2,3,5,23,24,25,26,27,28,29,30,31,32,52,53,61,62,64,78,79,80,81,82,83,84,85,86,],[19,19,-2,-13,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,19,19,19,-41,-51,-42,-43,-44,-45,-46,-47,-48,-49,-50,]),'CREATE':([0,2,3,5,23,24,25,26,27,28,29,30,31,32,53,61,62,64,78,79,80,81,82,83,84,85,86,],[20,20,-2,-13,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,20,20,-41,-51,-42,-43,-44,-45,-46,-47,-48,-49,-50,]),'PROCEDURE':([0,2,3,5,23,24,25,26,27,28,29,30,31,32,],[21,21,-2,-13,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,]),'CALL':([0,2,3,5,23,24,25,26,27,28,29,30,31,32,53,61,62,64,78,79,80,81,82,83,84,85,86,],[22,22,-2,-13,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,22,22,-41,-51,-42,-43,-44,-45,-46,-47,-48,-49,-50,]),'$end':([1,2,3,5,23,24,25,26,27,28,29,30,31,32,],[0,-1,-2,-13,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,]),'TABLE':([14,15,16,17,18,20,],[33,34,35,36,37,42,]),'ASTERISK':([19,],[40,]),'ID':([19,21,22,33,34,35,36,37,42,48,50,51,60,74,90,91,92,93,94,95,96,97,99,108,],[39,43,44,45,46,47,48,49,52,56,57,58,76,87,100,101,-29,-30,-31,-32,-33,-34,87,109,]),'FROM':([38,39,40,41,45,52,58,],[50,-25,-23,-24,54,60,-26,]),'COMMA':([39,41,58,],[-25,51,-26,]),'DO':([43,],[53,]),'AS':([46,],[55,]),'STRING':([54,55,91,92,93,94,95,96,97,],[72,73,104,-29,-30,-31,-32,-33,-34,]),'WHERE':([57,],[74,]),'LIMIT':([57,88,101,102,103,104,106,],[75,98,-35,-27,-36,-37,-28,]),'END':([61,62,64,78,79,80,81,82,83,84,85,86,],[77,-41,-51,-42,-43,-44,-45,-46,-47,-48,-49,-50,]),'NUMBER':([75,91,92,93,94,95,96,97,98,],[89,103,-29,-30,-31,-32,-33,-34,105,]),'JOIN':([76,],[90,]),'GT':([87,],[92,]),'LT':([87,],[93,]),'GE':([87,],[94,]),'LE':([87,],[95,]),'EQ':([87,],[96,]),'NE':([87,],[97,]),'AND':([88,101,102,103,104,106,],[99,-35,-27,-36,-37,-28,]),'USING':([100,],[107,]),'LPAREN':([107,],[108,]),'RPAREN':([109,],[110,]),}
+_lr_action_items = {'SEMICOLON':([0,2,3,4,5,6,7,8,9,10,11,12,13,23,24,25,26,27,28,29,30,31,32,46,49,51,56,59,60,61,62,65,67,68,69,70,71,72,73,74,75,76,77,78,79,80,82,85,86,87,88,89,90,91,92,93,94,95,97,102,104,106,107,108,116,119,132,133,136,137,138,139,140,141,142,148,149,151,158,163,167,170,172,173,174,175,],[5,5,-2,24,-13,25,26,27,28,29,30,31,32,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-80,-16,-18,70,-17,-33,-20,-21,-63,70,-69,87,-79,88,89,90,91,92,93,94,-14,-15,-33,-23,-68,-70,-71,-72,-73,-74,-75,-76,-77,-78,-33,-30,-64,-19,-32,-29,-40,-31,-43,-33,-65,-41,-42,-44,-46,-45,-61,-62,-51,-22,-28,-52,-47,-49,-66,-48,-50,-27,-67,]),'IMPORT':([0,2,3,5,23,24,25,26,27,28,29,30,31,32,56,67,68,70,86,87,88,89,90,91,92,93,94,],[14,14,-2,-13,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,14,14,-69,-79,-70,-71,-72,-73,-74,-75,-76,-77,-78,]),'EXPORT':([0,2,3,5,23,24,25,26,27,28,29,30,31,32,56,67,68,70,86,87,88,89,90,91,92,93,94,],[15,15,-2,-13,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,15,15,-69,-79,-70,-71,-72,-73,-74,-75,-76,-77,-78,]),'DISCARD':([0,2,3,5,23,24,25,26,27,28,29,30,31,32,56,67,68,70,86,87,88,89,90,91,92,93,94,],[16,16,-2,-13,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,16,16,-69,-79,-70,-71,-72,-73,-74,-75,-76,-77,-78,]),'RENAME':([0,2,3,5,23,24,25,26,27,28,29,30,31,32,56,67,68,70,86,87,88,89,90,91,92,93,94,],[17,17,-2,-13,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,17,17,-69,-79,-70,-71,-72,-73,-74,-75,-76,-77,-78,]),'PRINT':([0,2,3,5,23,24,25,26,27,28,29,30,31,32,56,67,68,70,86,87,88,89,90,91,92,93,94,],[18,18,-2,-13,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,18,18,-69,-79,-70,-71,-72,-73,-74,-75,-76,-77,-78,]),'SELECT':([0,2,3,5,23,24,25,26,27,28,29,30,31,32,55,56,67,68,70,86,87,88,89,90,91,92,93,94,],[19,19,-2,-13,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,19,19,19,-69,-79,-70,-71,-72,-73,-74,-75,-76,-77,-78,]),'CREATE':([0,2,3,5,23,24,25,26,27,28,29,30,31,32,56,67,68,70,86,87,88,89,90,91,92,93,94,],[20,20,-2,-13,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,20,20,-69,-79,-70,-71,-72,-73,-74,-75,-76,-77,-78,]),'PROCEDURE':([0,2,3,5,23,24,25,26,27,28,29,30,31,32,],[21,21,-2,-13,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,]),'CALL':([0,2,3,5,23,24,25,26,27,28,29,30,31,32,56,67,68,70,86,87,88,89,90,91,92,93,94,],[22,22,-2,-13,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,22,22,-69,-79,-70,-71,-72,-73,-74,-75,-76,-77,-78,]),'$end':([1,2,3,5,23,24,25,26,27,28,29,30,31,32,],[0,-1,-2,-13,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,]),'TABLE':([14,15,16,17,18,20,],[33,34,35,36,37,44,]),'ASTERISK':([19,],[39,]),'ID':([19,21,22,33,34,35,36,37,44,50,52,53,54,66,96,103,109,110,113,114,117,118,121,126,127,128,129,130,131,153,161,],[42,45,46,47,48,49,50,51,55,59,61,42,64,84,111,115,111,111,111,134,111,111,139,-55,-56,-57,-58,-59,-60,162,169,]),'APPROX_COUNT_DISTINCT':([19,53,],[43,43,]),'FROM':([38,39,40,41,42,47,55,63,83,],[52,-34,-35,-36,-38,57,66,-37,-39,]),'COMMA':([40,41,42,63,83,141,142,154,155,165,171,],[53,-36,-38,-37,-39,-61,-62,164,-53,164,-54,]),'LPAREN':([43,96,109,110,113,117,118,122,135,144,150,152,],[54,110,110,110,110,110,110,143,153,156,160,161,]),'DO':([45,],[56,]),'AS':([48,],[58,]),'STRING':([52,57,58,121,124,125,126,127,128,129,130,131,143,145,146,156,159,164,166,],[62,78,79,142,142,148,-55,-56,-57,-58,-59,-60,142,142,158,142,142,142,142,]),'TABLESAMPLE':([60,61,62,],[81,-20,-21,]),'WHERE':([60,61,62,80,82,102,132,149,151,170,174,175,],[-33,-20,-21,96,-23,113,-33,-22,-28,-66,-27,-67,]),'LIMIT':([60,61,62,80,82,95,97,107,108,119,132,136,137,138,139,140,141,142,148,149,151,158,163,167,172,173,174,],[-33,-20,-21,-33,-23,105,-30,-29,-40,-43,-33,-41,-42,-44,-46,-45,-61,-62,-51,-22,-28,-52,-47,-49,-48,-50,-27,]),'RPAREN':([64,108,119,120,136,137,138,139,140,141,142,148,154,155,158,162,163,165,167,168,169,171,172,173,],[83,-40,-43,138,-41,-42,-44,-46,-45,-61,-62,-51,163,-53,-52,170,-47,172,-49,174,175,-54,-48,-50,]),'END':([67,68,70,86,87,88,89,90,91,92,93,94,],[85,-69,-79,-70,-71,-72,-73,-74,-75,-76,-77,-78,]),'BERNOULLI':([81,],[99,]),'BLOCK':([81,],[100,]),'NUMBER':([81,98,99,100,101,105,121,124,126,127,128,129,130,131,143,145,156,159,160,164,166,],[-33,112,-24,-25,-26,116,141,141,-55,-56,-57,-58,-59,-60,141,141,141,141,168,141,141,]),'JOIN':([84,102,170,175,],[103,114,-66,-67,]),'NOT':([96,109,110,111,113,117,118,],[109,109,109,123,109,109,109,]),'AND':([107,108,119,120,133,136,137,138,139,140,141,142,147,148,157,158,163,167,172,173,],[117,-40,-43,117,117,-41,117,-44,-46,-45,-61,-62,159,-51,166,-52,-47,-49,-48,-50,]),'OR':([107,108,119,120,133,136,137,138,139,140,141,142,148,158,163,167,172,173,],[118,-40,-43,118,118,-41,-42,-44,-46,-45,-61,-62,-51,-52,-47,-49,-48,-50,]),'IN':([111,123,],[122,144,]),'BETWEEN':([111,123,],[124,145,]),'LIKE':([111,123,],[125,146,]),'GT':([111,],[126,]),'LT':([111,],[127,]),'GE':([111,],[128,]),'LE':([111,],[129,]),'EQ':([111,],[130,]),'NE':([111,],[131,]),'PERCENT':([112,],[132,]),'USING':([115,134,],[135,152,]),'REPEATABLE':([132,],[150,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'program':([0,],[1,]),'statement_list':([0,],[2,]),'statement':([0,2,],[3,23,]),'import_statement':([0,2,53,61,],[4,4,63,63,]),'export_statement':([0,2,53,61,],[6,6,65,65,]),'discard_statement':([0,2,53,61,],[7,7,66,66,]),'rename_statement':([0,2,53,61,],[8,8,67,67,]),'print_statement':([0,2,53,61,],[9,9,68,68,]),'select_statement':([0,2,52,53,61,],[10,10,59,69,69,]),'create_statement':([0,2,53,61,],[11,11,70,70,]),'procedure_definition':([0,2,],[12,12,]),'call_statement':([0,2,53,61,],[13,13,71,71,]),'column_list':([19,],[38,]),'column_id_list':([19,],[41,]),'proc_statement_list':([53,],[61,]),'proc_statement':([53,61,],[62,78,]),'condition':([74,99,],[88,106,]),'comparison_op':([87,],[91,]),'expression':([91,],[102,]),}
+_lr_goto_items = {'program':([0,],[1,]),'statement_list':([0,],[2,]),'statement':([0,2,],[3,23,]),'import_statement':([0,2,56,67,],[4,4,69,69,]),'export_statement':([0,2,56,67,],[6,6,71,71,]),'discard_statement':([0,2,56,67,],[7,7,72,72,]),'rename_statement':([0,2,56,67,],[8,8,73,73,]),'print_statement':([0,2,56,67,],[9,9,74,74,]),'select_statement':([0,2,55,56,67,],[10,10,65,75,75,]),'create_statement':([0,2,56,67,],[11,11,76,76,]),'procedure_definition':([0,2,],[12,12,]),'call_statement':([0,2,56,67,],[13,13,77,77,]),'column_list':([19,],[38,]),'column_id_list':([19,],[40,]),'select_item':([19,53,],[41,63,]),'source':([52,],[60,]),'proc_statement_list':([56,],[67,]),'proc_statement':([56,67,],[68,86,]),'opt_sample':([60,],[80,]),'empty':([60,80,81,95,132,],[82,97,101,106,151,]),'opt_where':([80,],[95,]),'sample_method':([81,],[98,]),'join_list':([84,],[102,]),'opt_limit':([95,],[104,]),'condition':([96,109,110,113,117,118,],[107,119,120,133,136,137,]),'predicate':([96,109,110,113,117,118,],[108,108,108,108,108,108,]),'comparison_op':([111,],[121,]),'literal':([121,124,143,145,156,159,164,166,],[140,147,155,157,155,167,171,173,]),'opt_seed':([132,],[149,]),'literal_list':([143,156,],[154,165,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,56 +27,84 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> program","S'",1,None,None,None),
-  ('program -> statement_list','program',1,'p_program','parser.py',26),
-  ('statement_list -> statement','statement_list',1,'p_statement_list','parser.py',30),
-  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list','parser.py',31),
-  ('statement -> import_statement SEMICOLON','statement',2,'p_statement','parser.py',41),
-  ('statement -> export_statement SEMICOLON','statement',2,'p_statement','parser.py',42),
-  ('statement -> discard_statement SEMICOLON','statement',2,'p_statement','parser.py',43),
-  ('statement -> rename_statement SEMICOLON','statement',2,'p_statement','parser.py',44),
-  ('statement -> print_statement SEMICOLON','statement',2,'p_statement','parser.py',45),
-  ('statement -> select_statement SEMICOLON','statement',2,'p_statement','parser.py',46),
-  ('statement -> create_statement SEMICOLON','statement',2,'p_statement','parser.py',47),
-  ('statement -> procedure_definition SEMICOLON','statement',2,'p_statement','parser.py',48),
-  ('statement -> call_statement SEMICOLON','statement',2,'p_statement','parser.py',49),
-  ('statement -> SEMICOLON','statement',1,'p_empty_statement','parser.py',53),
-  ('import_statement -> IMPORT TABLE ID FROM STRING','import_statement',5,'p_import_statement','parser.py',57),
-  ('export_statement -> EXPORT TABLE ID AS STRING','export_statement',5,'p_export_statement','parser.py',61),
-  ('discard_statement -> DISCARD TABLE ID','discard_statement',3,'p_discard_statement','parser.py',65),
-  ('rename_statement -> RENAME TABLE ID ID','rename_statement',4,'p_rename_statement','parser.py',69),
-  ('print_statement -> PRINT TABLE ID','print_statement',3,'p_print_statement','parser.py',73),
-  ('select_statement -> SELECT column_list FROM ID','select_statement',4,'p_select_statement','parser.py',77),
-  ('select_statement -> SELECT column_list FROM ID WHERE condition','select_statement',6,'p_select_statement','parser.py',78),
-  ('select_statement -> SELECT column_list FROM ID LIMIT NUMBER','select_statement',6,'p_select_statement','parser.py',79),
-  ('select_statement -> SELECT column_list FROM ID WHERE condition LIMIT NUMBER','select_statement',8,'p_select_statement','parser.py',80),
-  ('column_list -> ASTERISK','column_list',1,'p_column_list','parser.py',92),
-  ('column_list -> column_id_list','column_list',1,'p_column_list','parser.py',93),
-  ('column_id_list -> ID','column_id_list',1,'p_column_id_list','parser.py',97),
-  ('column_id_list -> column_id_list COMMA ID','column_id_list',3,'p_column_id_list','parser.py',98),
-  ('condition -> ID comparison_op expression','condition',3,'p_condition','parser.py',106),
-  ('condition -> condition AND condition','condition',3,'p_condition','parser.py',107),
-  ('comparison_op -> GT','comparison_op',1,'p_comparison_op','parser.py',114),
-  ('comparison_op -> LT','comparison_op',1,'p_comparison_op','parser.py',115),
-  ('comparison_op -> GE','comparison_op',1,'p_comparison_op','parser.py',116),
-  ('comparison_op -> LE','comparison_op',1,'p_comparison_op','parser.py',117),
-  ('comparison_op -> EQ','comparison_op',1,'p_comparison_op','parser.py',118),
-  ('comparison_op -> NE','comparison_op',1,'p_comparison_op','parser.py',119),
-  ('expression -> ID','expression',1,'p_expression','parser.py',123),
-  ('expression -> NUMBER','expression',1,'p_expression','parser.py',124),
-  ('expression -> STRING','expression',1,'p_expression','parser.py',125),
-  ('create_statement -> CREATE TABLE ID select_statement','create_statement',4,'p_create_statement','parser.py',129),
-  ('create_statement -> CREATE TABLE ID FROM ID JOIN ID USING LPAREN ID RPAREN','create_statement',11,'p_create_statement','parser.py',130),
-  ('procedure_definition -> PROCEDURE ID DO proc_statement_list END','procedure_definition',5,'p_procedure_definition','parser.py',137),
-  ('proc_statement_list -> proc_statement','proc_statement_list',1,'p_proc_statement_list','parser.py',141),
-  ('proc_statement_list -> proc_statement_list proc_statement','proc_statement_list',2,'p_proc_statement_list','parser.py',142),
-  ('proc_statement -> import_statement SEMICOLON','proc_statement',2,'p_proc_statement','parser.py',152),
-  ('proc_statement -> export_statement SEMICOLON','proc_statement',2,'p_proc_statement','parser.py',153),
-  ('proc_statement -> discard_statement SEMICOLON','proc_statement',2,'p_proc_statement','parser.py',154),
-  ('proc_statement -> rename_statement SEMICOLON','proc_statement',2,'p_proc_statement','parser.py',155),
-  ('proc_statement -> print_statement SEMICOLON','proc_statement',2,'p_proc_statement','parser.py',156),
-  ('proc_statement -> select_statement SEMICOLON','proc_statement',2,'p_proc_statement','parser.py',157),
-  ('proc_statement -> create_statement SEMICOLON','proc_statement',2,'p_proc_statement','parser.py',158),
-  ('proc_statement -> call_statement SEMICOLON','proc_statement',2,'p_proc_statement','parser.py',159),
-  ('proc_statement -> SEMICOLON','proc_statement',1,'p_proc_statement','parser.py',160),
-  ('call_statement -> CALL ID','call_statement',2,'p_call_statement','parser.py',167),
+  ('program -> statement_list','program',1,'p_program','parser.py',28),
+  ('statement_list -> statement','statement_list',1,'p_statement_list','parser.py',32),
+  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list','parser.py',33),
+  ('statement -> import_statement SEMICOLON','statement',2,'p_statement','parser.py',43),
+  ('statement -> export_statement SEMICOLON','statement',2,'p_statement','parser.py',44),
+  ('statement -> discard_statement SEMICOLON','statement',2,'p_statement','parser.py',45),
+  ('statement -> rename_statement SEMICOLON','statement',2,'p_statement','parser.py',46),
+  ('statement -> print_statement SEMICOLON','statement',2,'p_statement','parser.py',47),
+  ('statement -> select_statement SEMICOLON','statement',2,'p_statement','parser.py',48),
+  ('statement -> create_statement SEMICOLON','statement',2,'p_statement','parser.py',49),
+  ('statement -> procedure_definition SEMICOLON','statement',2,'p_statement','parser.py',50),
+  ('statement -> call_statement SEMICOLON','statement',2,'p_statement','parser.py',51),
+  ('statement -> SEMICOLON','statement',1,'p_empty_statement','parser.py',55),
+  ('import_statement -> IMPORT TABLE ID FROM STRING','import_statement',5,'p_import_statement','parser.py',59),
+  ('export_statement -> EXPORT TABLE ID AS STRING','export_statement',5,'p_export_statement','parser.py',63),
+  ('discard_statement -> DISCARD TABLE ID','discard_statement',3,'p_discard_statement','parser.py',67),
+  ('rename_statement -> RENAME TABLE ID ID','rename_statement',4,'p_rename_statement','parser.py',71),
+  ('print_statement -> PRINT TABLE ID','print_statement',3,'p_print_statement','parser.py',75),
+  ('select_statement -> SELECT column_list FROM source opt_sample opt_where opt_limit','select_statement',7,'p_select_statement','parser.py',79),
+  ('source -> ID','source',1,'p_source','parser.py',83),
+  ('source -> STRING','source',1,'p_source','parser.py',84),
+  ('opt_sample -> TABLESAMPLE sample_method NUMBER PERCENT opt_seed','opt_sample',5,'p_opt_sample','parser.py',91),
+  ('opt_sample -> empty','opt_sample',1,'p_opt_sample','parser.py',92),
+  ('sample_method -> BERNOULLI','sample_method',1,'p_sample_method','parser.py',99),
+  ('sample_method -> BLOCK','sample_method',1,'p_sample_method','parser.py',100),
+  ('sample_method -> empty','sample_method',1,'p_sample_method','parser.py',101),
+  ('opt_seed -> REPEATABLE LPAREN NUMBER RPAREN','opt_seed',4,'p_opt_seed','parser.py',105),
+  ('opt_seed -> empty','opt_seed',1,'p_opt_seed','parser.py',106),
+  ('opt_where -> WHERE condition','opt_where',2,'p_opt_where','parser.py',110),
+  ('opt_where -> empty','opt_where',1,'p_opt_where','parser.py',111),
+  ('opt_limit -> LIMIT NUMBER','opt_limit',2,'p_opt_limit','parser.py',115),
+  ('opt_limit -> empty','opt_limit',1,'p_opt_limit','parser.py',116),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',120),
+  ('column_list -> ASTERISK','column_list',1,'p_column_list','parser.py',124),
+  ('column_list -> column_id_list','column_list',1,'p_column_list','parser.py',125),
+  ('column_id_list -> select_item','column_id_list',1,'p_column_id_list','parser.py',129),
+  ('column_id_list -> column_id_list COMMA select_item','column_id_list',3,'p_column_id_list','parser.py',130),
+  ('select_item -> ID','select_item',1,'p_select_item','parser.py',138),
+  ('select_item -> APPROX_COUNT_DISTINCT LPAREN ID RPAREN','select_item',4,'p_select_item','parser.py',139),
+  ('condition -> predicate','condition',1,'p_condition','parser.py',146),
+  ('condition -> condition AND condition','condition',3,'p_condition','parser.py',147),
+  ('condition -> condition OR condition','condition',3,'p_condition','parser.py',148),
+  ('condition -> NOT condition','condition',2,'p_condition','parser.py',149),
+  ('condition -> LPAREN condition RPAREN','condition',3,'p_condition','parser.py',150),
+  ('predicate -> ID comparison_op literal','predicate',3,'p_predicate_compare','parser.py',161),
+  ('predicate -> ID comparison_op ID','predicate',3,'p_predicate_compare','parser.py',162),
+  ('predicate -> ID IN LPAREN literal_list RPAREN','predicate',5,'p_predicate_in','parser.py',169),
+  ('predicate -> ID NOT IN LPAREN literal_list RPAREN','predicate',6,'p_predicate_in','parser.py',170),
+  ('predicate -> ID BETWEEN literal AND literal','predicate',5,'p_predicate_between','parser.py',177),
+  ('predicate -> ID NOT BETWEEN literal AND literal','predicate',6,'p_predicate_between','parser.py',178),
+  ('predicate -> ID LIKE STRING','predicate',3,'p_predicate_like','parser.py',185),
+  ('predicate -> ID NOT LIKE STRING','predicate',4,'p_predicate_like','parser.py',186),
+  ('literal_list -> literal','literal_list',1,'p_literal_list','parser.py',193),
+  ('literal_list -> literal_list COMMA literal','literal_list',3,'p_literal_list','parser.py',194),
+  ('comparison_op -> GT','comparison_op',1,'p_comparison_op','parser.py',202),
+  ('comparison_op -> LT','comparison_op',1,'p_comparison_op','parser.py',203),
+  ('comparison_op -> GE','comparison_op',1,'p_comparison_op','parser.py',204),
+  ('comparison_op -> LE','comparison_op',1,'p_comparison_op','parser.py',205),
+  ('comparison_op -> EQ','comparison_op',1,'p_comparison_op','parser.py',206),
+  ('comparison_op -> NE','comparison_op',1,'p_comparison_op','parser.py',207),
+  ('literal -> NUMBER','literal',1,'p_literal','parser.py',211),
+  ('literal -> STRING','literal',1,'p_literal','parser.py',212),
+  ('create_statement -> CREATE TABLE ID select_statement','create_statement',4,'p_create_statement','parser.py',216),
+  ('create_statement -> CREATE TABLE ID FROM ID join_list','create_statement',6,'p_create_statement','parser.py',217),
+  ('create_statement -> CREATE TABLE ID FROM ID join_list WHERE condition','create_statement',8,'p_create_statement','parser.py',218),
+  ('join_list -> JOIN ID USING LPAREN ID RPAREN','join_list',6,'p_join_list','parser.py',227),
+  ('join_list -> join_list JOIN ID USING LPAREN ID RPAREN','join_list',7,'p_join_list','parser.py',228),
+  ('procedure_definition -> PROCEDURE ID DO proc_statement_list END','procedure_definition',5,'p_procedure_definition','parser.py',236),
+  ('proc_statement_list -> proc_statement','proc_statement_list',1,'p_proc_statement_list','parser.py',240),
+  ('proc_statement_list -> proc_statement_list proc_statement','proc_statement_list',2,'p_proc_statement_list','parser.py',241),
+  ('proc_statement -> import_statement SEMICOLON','proc_statement',2,'p_proc_statement','parser.py',251),
+  ('proc_statement -> export_statement SEMICOLON','proc_statement',2,'p_proc_statement','parser.py',252),
+  ('proc_statement -> discard_statement SEMICOLON','proc_statement',2,'p_proc_statement','parser.py',253),
+  ('proc_statement -> rename_statement SEMICOLON','proc_statement',2,'p_proc_statement','parser.py',254),
+  ('proc_statement -> print_statement SEMICOLON','proc_statement',2,'p_proc_statement','parser.py',255),
+  ('proc_statement -> select_statement SEMICOLON','proc_statement',2,'p_proc_statement','parser.py',256),
+  ('proc_statement -> create_statement SEMICOLON','proc_statement',2,'p_proc_statement','parser.py',257),
+  ('proc_statement -> call_statement SEMICOLON','proc_statement',2,'p_proc_statement','parser.py',258),
+  ('proc_statement -> SEMICOLON','proc_statement',1,'p_proc_statement','parser.py',259),
+  ('call_statement -> CALL ID','call_statement',2,'p_call_statement','parser.py',266),
 ]
@@ -0,0 +1,105 @@
+import os
+from itertools import compress
+import numpy as np
+import pandas as pd
+
+BLOCK_ROWS = 1024             # Máximo de linhas por bloco na amostragem por blocos em memória
+BLOCK_BYTES = 64 * 1024       # Máximo de bytes por bloco na amostragem por blocos de ficheiros
+BERNOULLI_CHUNK_BYTES = 1 << 20  # Bytes lidos de cada vez na amostragem BERNOULLI de ficheiros
+MIN_BLOCKS = 64               # Tabelas e ficheiros pequenos são divididos em pelo menos este número de blocos
+HLL_PRECISION = 14            # 2^14 registos, erro padrão de ~0.8%
+
+def sample_dataframe(df, method, percent, seed=None):
+    """Devolve uma amostra de uma tabela em memória (BERNOULLI ou BLOCK).
+
+    O resultado é o par (amostra, fração de linhas efetivamente lida).
+    """
+    fraction = min(max(percent / 100.0, 0.0), 1.0)
+    rng = np.random.default_rng(seed)
+    if method == 'block':
+        block_rows = max(min(BLOCK_ROWS, len(df) // MIN_BLOCKS), 1)
+        n_blocks = -(-len(df) // block_rows)
+        keep = np.repeat(rng.random(n_blocks) < fraction, block_rows)[:len(df)]
+    else:
+        keep = rng.random(len(df)) < fraction
+    sample = df[keep]
+    return sample, (len(sample) / len(df) if len(df) else 1.0)
+
+def read_csv_sample(filename, method, percent, seed=None):
+    """Lê apenas uma amostra das linhas de um ficheiro CSV.
+
+    Com BLOCK são lidos blocos de até BLOCK_BYTES escolhidos ao acaso, saltando
+    diretamente para a sua posição no ficheiro; cada linha pertence ao bloco
+    onde começa. Com BERNOULLI o ficheiro é percorrido uma vez, mas só as
+    linhas escolhidas são interpretadas. Cada bloco (ou linha) é escolhido de
+    forma independente com a probabilidade pedida, e é devolvido o par
+    (texto CSV com o cabeçalho e as linhas escolhidas, fração do ficheiro
+    efetivamente lida), para ser interpretado pelo mesmo leitor do IMPORT.
+    """
+    fraction = min(max(percent / 100.0, 0.0), 1.0)
+    rng = np.random.default_rng(seed)
+    with open(filename, 'rb') as file:
+        header = file.readline()
+        while header.lstrip().startswith(b'#'):
+            header = file.readline()
+        data_start = file.tell()
+        lines = []
+        if method == 'block':
+            size = os.fstat(file.fileno()).st_size - data_start
+            block_bytes = max(min(BLOCK_BYTES, size // MIN_BLOCKS), 1)
+            n_blocks = max(-(-size // block_bytes), 1)
+            chosen = np.flatnonzero(rng.random(n_blocks) < fraction)
+            bytes_read = 0
+            for block in chosen:
+                start = data_start + int(block) * block_bytes
+                end = start + block_bytes
+                bytes_read += min(end, data_start + size) - start
+                file.seek(start - 1 if start > data_start else start)
+                if start > data_start:
+                    # Descartar o resto da linha que começou no bloco anterior
+                    file.readline()
+                while file.tell() < end:
+                    line = file.readline()
+                    if not line:
+                        break
+                    lines.append(line)
+            fraction_read = bytes_read / size if size else 1.0
+        else:
+            total = 0
+            # Sortear em lotes: uma chamada ao gerador por cada bloco de linhas
+            for chunk in iter(lambda: file.readlines(BERNOULLI_CHUNK_BYTES), []):
+                total += len(chunk)
+                lines.extend(compress(chunk, rng.random(len(chunk)) < fraction))
+            fraction_read = len(lines) / total if total else 1.0
+    text = header + b''.join(line if line.endswith(b'\n') else line + b'\n' for line in lines)
+    return text.decode('utf-8', errors='replace'), fraction_read
+
+def approx_count_distinct(series):
+    """Estima o número de valores distintos com HyperLogLog (valores nulos são ignorados)."""
+    series = series.dropna()
+    m = 1 << HLL_PRECISION
+    if series.empty:
+        return 0
+    hashes = pd.util.hash_pandas_object(series, index=False).to_numpy(dtype=np.uint64)
+    index = (hashes >> np.uint64(64 - HLL_PRECISION)).astype(np.int64)
+    rest_bits = 64 - HLL_PRECISION
+    rest = hashes & np.uint64((1 << rest_bits) - 1)
+    # rest tem menos de 53 bits, por isso frexp dá o comprimento exato em bits
+    bit_length = np.frexp(rest.astype(np.float64))[1]
+    rank = (rest_bits - bit_length + 1).astype(np.int8)
+    registers = np.zeros(m, dtype=np.int8)
+    np.maximum.at(registers, index, rank)
+    alpha = 0.7213 / (1 + 1.079 / m)
+    estimate = alpha * m * m / np.sum(np.power(2.0, -registers.astype(np.float64)))
+    zeros = int(np.count_nonzero(registers == 0))
+    if estimate <= 2.5 * m and zeros:
+        estimate = m * np.log(m / zeros)
+    return int(round(estimate))
+
+def estimate_distinct_from_sample(series, fraction):
+    """Estima os valores distintos da tabela completa a partir de uma amostra (estimador GEE)."""
+    counts = series.dropna().value_counts()
+    if fraction >= 1.0 or counts.empty:
+        return len(counts)
+    singletons = int((counts == 1).sum())
+    return int(round(np.sqrt(1.0 / fraction) * singletons + (len(counts) - singletons)))
@@ -0,0 +1,263 @@
+import hashlib
+import os
+import time
+from executor import CommandExecutor, TableManager
+
+def file_fingerprint(filename):
+    """Devolve (tamanho, data de modificação, sha1) de um ficheiro, ou None se não existir."""
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    digest = hashlib.sha1()
+    with open(filename, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 20), b''):
+            digest.update(chunk)
+    return (stat.st_size, stat.st_mtime_ns, digest.hexdigest())
+
+def fingerprint_changed(old, filename):
+    """Verifica se um ficheiro mudou, evitando ler o conteúdo se tamanho e data forem iguais."""
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return old is not None
+    if old is None:
+        return True
+    if (stat.st_size, stat.st_mtime_ns) == old[:2]:
+        return False
+    new = file_fingerprint(filename)
+    return new is None or (new[0], new[2]) != (old[0], old[2])
+
+class StatementLineage:
+    """Tabelas e ficheiros lidos e escritos por uma instrução de topo."""
+    def __init__(self):
+        self.read_tables = set()
+        self.write_tables = set()
+        self.dropped_tables = set()
+        self.read_files = set()
+        self.write_files = set()
+
+def add_select_source(lineage, select):
+    """Regista a origem de um SELECT, que pode ser uma tabela ou um ficheiro CSV."""
+    if isinstance(select[2], tuple):
+        lineage.read_files.add(select[2][1].strip('"\''))
+    else:
+        lineage.read_tables.add(select[2])
+
+def statement_lineage(statement, procedures, visiting=()):
+    """Calcula a linhagem de uma instrução (expandindo chamadas a procedimentos)."""
+    lineage = StatementLineage()
+    cmd_type = statement[0]
+    if cmd_type == 'import_table':
+        lineage.read_files.add(statement[2].strip('"\''))
+        lineage.write_tables.add(statement[1])
+    elif cmd_type == 'export_table':
+        lineage.read_tables.add(statement[1])
+        lineage.write_files.add(statement[2].strip('"\''))
+    elif cmd_type == 'discard_table':
+        lineage.dropped_tables.add(statement[1])
+    elif cmd_type == 'rename_table':
+        lineage.read_tables.add(statement[1])
+        lineage.dropped_tables.add(statement[1])
+        lineage.write_tables.add(statement[2])
+    elif cmd_type == 'print_table':
+        lineage.read_tables.add(statement[1])
+    elif cmd_type == 'select':
+        add_select_source(lineage, statement)
+    elif cmd_type == 'create_select':
+        add_select_source(lineage, statement[2])
+        lineage.write_tables.add(statement[1])
+    elif cmd_type == 'create_join':
+        lineage.read_tables.add(statement[2])
+        lineage.read_tables.update(table for table, _ in statement[3])
+        lineage.write_tables.add(statement[1])
+    elif cmd_type == 'call_procedure' and statement[1] in procedures and statement[1] not in visiting:
+        for stmt in procedures[statement[1]]:
+            if not stmt:
+                continue
+            inner = statement_lineage(stmt, procedures, visiting + (statement[1],))
+            # Tabelas produzidas dentro do procedimento não são dependências externas
+            lineage.read_tables.update(inner.read_tables - lineage.write_tables)
+            lineage.write_tables.update(inner.write_tables)
+            lineage.write_tables.difference_update(inner.dropped_tables)
+            lineage.dropped_tables.update(inner.dropped_tables)
+            lineage.read_files.update(inner.read_files)
+            lineage.write_files.update(inner.write_files)
+    return lineage
+
+def describe_statement(index, statement):
+    """Descrição curta de uma instrução para os relatórios."""
+    names = [str(part) for part in statement[1:3] if isinstance(part, str)]
+    return f"#{index + 1} {statement[0]} {' '.join(names)}".strip()
+
+class ScriptWatcher:
+    """Executa um script .fca e volta a executá-lo quando os ficheiros de entrada mudam.
+
+    Os resultados de cada instrução são guardados entre execuções; numa nova
+    execução só são recalculadas as instruções que dependem (direta ou
+    indiretamente) de ficheiros alterados, e só os EXPORT afetados são reescritos.
+    Como a cache mantém todas as tabelas em memória, este modo não usa o limite
+    de memória do TableManager.
+    """
+    def __init__(self, parser, filename, interval=2.0):
+        self.parser = parser
+        self.filename = filename
+        self.interval = interval
+        self.statements = None
+        self.script_fingerprint = None
+        self.input_fingerprints = {}   # ficheiro -> impressão digital na última execução
+        self.pending_fingerprints = {} # entradas alteradas ainda não processadas com sucesso
+        self.output_fingerprints = {}  # ficheiro exportado -> impressão digital após a escrita
+        self.cache = {}                # índice da instrução -> {tabela: DataFrame}
+        self.table_manager = None
+
+    def load_script(self):
+        """Lê e parseia o script; invalida a cache se o script mudou."""
+        with open(self.filename, 'r') as file:
+            content = file.read()
+        self.statements = [stmt for stmt in (self.parser.parse(content) or []) if stmt]
+        self.script_fingerprint = file_fingerprint(self.filename)
+        self.input_fingerprints = {}
+        self.output_fingerprints = {}
+        self.cache = {}
+
+    def changed_inputs(self):
+        """Devolve o conjunto de ficheiros de entrada alterados desde a última execução.
+
+        As novas impressões digitais ficam pendentes e só são guardadas quando
+        a execução seguinte termina sem erros.
+        """
+        changed = set()
+        self.pending_fingerprints = {}
+        for filename, old in list(self.input_fingerprints.items()):
+            try:
+                stat = os.stat(filename)
+            except OSError:
+                if old is not None:
+                    changed.add(filename)
+                    self.pending_fingerprints[filename] = None
+                continue
+            if old is not None and (stat.st_size, stat.st_mtime_ns) == old[:2]:
+                continue
+            new = file_fingerprint(filename)
+            if old is None or new is None or (new[0], new[2]) != (old[0], old[2]):
+                changed.add(filename)
+                self.pending_fingerprints[filename] = new
+            else:
+                # Conteúdo igual: guardar a nova data para não voltar a ler o ficheiro
+                self.input_fingerprints[filename] = new
+        return changed
+
+    def run_once(self, changed_files=None):
+        """Executa o script, reutilizando a cache para as instruções não afetadas.
+
+        As impressões digitais das entradas só são guardadas se a execução
+        terminar; se uma instrução falhar, as alterações voltam a ser detetadas
+        na verificação seguinte e as instruções afetadas são repetidas.
+        """
+        fingerprints = dict(self.input_fingerprints)
+        fingerprints.update(self.pending_fingerprints)
+        try:
+            procedures = {}
+            table_manager = TableManager()
+            executor = CommandExecutor(table_manager)
+            dirty_tables = set()
+            dirty_files = set(changed_files or ())   # Entradas alteradas e ficheiros reescritos nesta execução
+            executed, skipped = [], []
+            for index, stmt in enumerate(self.statements):
+                if stmt[0] == 'procedure_def':
+                    procedures[stmt[1]] = stmt[2]
+                    table_manager.add_procedure(stmt[1], stmt[2])
+                    continue
+                lineage = statement_lineage(stmt, procedures)
+                dirty = (changed_files is None
+                         or index not in self.cache
+                         or bool(lineage.read_files & dirty_files)
+                         or bool(lineage.read_tables & dirty_tables)
+                         or any(fingerprint_changed(self.output_fingerprints.get(f), f)
+                                for f in lineage.write_files))
+                if dirty:
+                    executor.execute_statement(stmt)
+                    self.cache[index] = {name: table_manager.get_table(name)
+                                         for name in lineage.write_tables
+                                         if table_manager.has_table(name)}
+                    for filename in lineage.write_files:
+                        self.output_fingerprints[filename] = file_fingerprint(filename)
+                    dirty_tables.update(lineage.write_tables)
+                    dirty_files.update(lineage.write_files)
+                    executed.append(describe_statement(index, stmt))
+                else:
+                    self.replay_statement(stmt, table_manager, executor, index)
+                    dirty_tables.difference_update(lineage.write_tables)
+                    skipped.append(describe_statement(index, stmt))
+                dirty_tables.difference_update(lineage.dropped_tables - lineage.write_tables)
+                if dirty:
+                    for filename in lineage.read_files:
+                        self.refresh_input_fingerprint(fingerprints, filename, changed_files)
+        except Exception:
+            # Numa execução completa guardam-se as entradas já lidas, para que
+            # uma alteração posterior volte a executar as instruções em falta
+            if changed_files is None:
+                self.input_fingerprints = fingerprints
+            raise
+        self.input_fingerprints = fingerprints
+        self.pending_fingerprints = {}
+        self.table_manager = table_manager
+        return executed, skipped
+
+    def refresh_input_fingerprint(self, fingerprints, filename, changed_files):
+        """Atualiza a impressão digital de um ficheiro lido, relendo-o só se necessário."""
+        old = fingerprints.get(filename)
+        if old is None or changed_files is None or fingerprint_changed(old, filename):
+            fingerprints[filename] = file_fingerprint(filename)
+
+    def replay_statement(self, stmt, table_manager, executor, index):
+        """Reconstrói o efeito de uma instrução não afetada a partir da cache."""
+        if stmt[0] in ('discard_table', 'rename_table'):
+            executor.execute_statement(stmt)
+        else:
+            for name, df in self.cache[index].items():
+                table_manager.add_table(name, df)
+
+    def report(self, executed, skipped):
+        print(f"\nInstruções executadas ({len(executed)}): {', '.join(executed) or '-'}")
+        print(f"Instruções ignoradas ({len(skipped)}): {', '.join(skipped) or '-'}")
+
+    def watch(self):
+        """Ciclo principal: executa o script e repete sempre que algo muda."""
+        if not self.filename.endswith('.fca'):
+            print(f"Erro: O arquivo '{self.filename}' deve ter a extensão .fca")
+            return
+        try:
+            self.load_script()
+        except FileNotFoundError:
+            print(f"Arquivo não encontrado: {self.filename}")
+            return
+        print(f"A observar '{self.filename}' (Ctrl+C para sair)")
+        try:
+            self.run_safely(self.run_once)
+            while True:
+                time.sleep(self.interval)
+                if fingerprint_changed(self.script_fingerprint, self.filename):
+                    print(f"\nScript '{self.filename}' alterado, a executar tudo novamente...")
+                    self.run_safely(self.reload_and_run)
+                    continue
+                changed = self.changed_inputs()
+                if changed:
+                    print(f"\nFicheiros alterados: {', '.join(sorted(changed))}")
+                    self.run_safely(self.run_once, changed)
+        except KeyboardInterrupt:
+            print("\nSaindo...")
+
+    def reload_and_run(self):
+        self.load_script()
+        return self.run_once()
+
+    def run_safely(self, run, *args):
+        """Executa o script e mostra o relatório, sem terminar o modo --watch em caso de erro."""
+        try:
+            self.report(*run(*args))
+        except FileNotFoundError:
+            print(f"Arquivo não encontrado: {self.filename}")
+        except Exception as e:
+            print(f"Erro ao processar arquivo: {e}")